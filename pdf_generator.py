@@ -1,18 +1,29 @@
 import os
+import re
 import qrcode
 import pandas as pd
+from io import BytesIO
+from contextlib import nullcontext
+import multiprocessing as mp
+from functools import lru_cache, partial
 from PIL import Image
 import arabic_reshaper
-from typing import Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from reportlab.pdfgen import canvas
+from reportlab.lib.colors import toColor
 from bidi.algorithm import get_display
 from reportlab.pdfbase import pdfmetrics
-from reportlab.lib.utils import ImageReader
 from reportlab.pdfbase.ttfonts import TTFont
 
+# QR code modules by row (border included), each row packed into an int
+# whose bits are set for dark modules, leftmost module first. This keeps a
+# version-8 matrix at about 2.5 KB instead of about 29 KB as tuples of bools
+QRMatrix = Tuple[int, ...]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class QRCodeConfig:
     """Configuration settings for QR code generation."""
 
@@ -22,9 +33,12 @@ class QRCodeConfig:
     border: int
     fill_color: str
     back_color: str
+    # Fixed mask pattern (0-7); None searches for the best one, which takes
+    # about 2/3 of the generation time and only matters for scan robustness
+    mask_pattern: Optional[int] = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PDFConfig:
     """Configuration settings for PDF generation."""
 
@@ -45,7 +59,11 @@ class PDFConfig:
 class FarsiTextProcessor:
     """Handles Farsi text processing for correct display."""
 
+    # Shared reshaper, configured once for all texts
+    reshaper = arabic_reshaper.ArabicReshaper()
+
     @staticmethod
+    @lru_cache(maxsize=4096)
     def process_text(raw_text: str) -> str:
         """
         Process Farsi text for correct display.
@@ -56,10 +74,139 @@ class FarsiTextProcessor:
         Returns:
             Correctly processed Farsi text
         """
-        reshaped_text = arabic_reshaper.reshape(raw_text)
+        reshaped_text = FarsiTextProcessor.reshaper.reshape(raw_text)
         return get_display(reshaped_text)
 
 
+def _make_qr(
+    data: str,
+    version: int,
+    error_correction: int,
+    box_size: int,
+    border: int,
+    mask_pattern: Optional[int],
+) -> qrcode.QRCode:
+    """
+    Build a QR code for the given data.
+
+    Args:
+        data: The data to encode in the QR code
+        version: QR code version
+        error_correction: Error correction level
+        box_size: Size of each box in pixels
+        border: Border thickness in boxes
+        mask_pattern: Fixed mask pattern, or None to search for the best one
+
+    Returns:
+        The compiled QR code
+    """
+    qr = qrcode.QRCode(
+        version=version,
+        error_correction=error_correction,
+        box_size=box_size,
+        border=border,
+        mask_pattern=mask_pattern,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr
+
+
+def _pack_matrix(qr: qrcode.QRCode) -> QRMatrix:
+    """
+    Pack the modules of a compiled QR code into one int per row.
+
+    Args:
+        qr: The compiled QR code
+
+    Returns:
+        The QR code modules by row
+    """
+    return tuple(
+        int("".join("1" if dark else "0" for dark in row), 2)
+        for row in qr.get_matrix()
+    )
+
+
+def _encode_png(qr: qrcode.QRCode, fill_color: str, back_color: str) -> bytes:
+    """
+    Encode a compiled QR code as PNG.
+
+    Args:
+        qr: The compiled QR code
+        fill_color: Color of the QR code modules
+        back_color: Background color
+
+    Returns:
+        The PNG-encoded QR code
+    """
+    # QR bitmaps are tiny; light compression is much cheaper to encode
+    buffer = BytesIO()
+    qr.make_image(fill=fill_color, back_color=back_color).save(
+        buffer, format="PNG", compress_level=1
+    )
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=4096)
+def _build_qr_matrix(
+    data: str,
+    version: int,
+    error_correction: int,
+    border: int,
+    mask_pattern: Optional[int],
+) -> QRMatrix:
+    """
+    Build a QR code module matrix, reusing the result for repeated inputs.
+
+    Args:
+        data: The data to encode in the QR code
+        version: QR code version
+        error_correction: Error correction level
+        border: Border thickness in boxes
+        mask_pattern: Fixed mask pattern, or None to search for the best one
+
+    Returns:
+        The QR code modules by row
+    """
+    qr = _make_qr(data, version, error_correction, 1, border, mask_pattern)
+    return _pack_matrix(qr)
+
+
+# Numbers are usually unique IDs, so repeats are rare; keep this cache small
+# as each entry also holds the encoded PNG
+@lru_cache(maxsize=256)
+def _build_qr_matrix_and_png(
+    data: str,
+    version: int,
+    error_correction: int,
+    box_size: int,
+    border: int,
+    fill_color: str,
+    back_color: str,
+    mask_pattern: Optional[int],
+) -> Tuple[QRMatrix, bytes]:
+    """
+    Build a QR code module matrix and its PNG encoding from a single QR code,
+    reusing the result for repeated inputs.
+
+    Args:
+        data: The data to encode in the QR code
+        version: QR code version
+        error_correction: Error correction level
+        box_size: Size of each box in pixels
+        border: Border thickness in boxes
+        fill_color: Color of the QR code modules
+        back_color: Background color
+        mask_pattern: Fixed mask pattern, or None to search for the best one
+
+    Returns:
+        The QR code modules by row and the PNG-encoded QR code
+    """
+    qr = _make_qr(data, version, error_correction, box_size, border, mask_pattern)
+    return _pack_matrix(qr), _encode_png(qr, fill_color, back_color)
+
+
 class QRCodeGenerator:
     """Class responsible for generating QR codes."""
 
@@ -76,17 +223,59 @@ class QRCodeGenerator:
         Returns:
             A QR code image object
         """
-        qr = qrcode.QRCode(
-            version=self.config.version,
-            error_correction=self.config.error_correction,
-            box_size=self.config.box_size,
-            border=self.config.border,
+        return Image.open(BytesIO(self.encode_png(data)))
+
+    def encode_png(self, data: str) -> bytes:
+        """
+        Generate a QR code for the given data and encode it as PNG.
+
+        Args:
+            data: The data to encode in the QR code
+
+        Returns:
+            The PNG-encoded QR code
+        """
+        return self.generate_matrix_and_png(data)[1]
+
+    def generate_matrix_and_png(self, data: str) -> Tuple[QRMatrix, bytes]:
+        """
+        Generate the QR code module matrix for the given data along with its
+        PNG encoding, building the QR code only once.
+
+        Args:
+            data: The data to encode in the QR code
+
+        Returns:
+            The QR code modules by row, border included, and the PNG-encoded
+            QR code
+        """
+        return _build_qr_matrix_and_png(
+            data,
+            self.config.version,
+            self.config.error_correction,
+            self.config.box_size,
+            self.config.border,
+            self.config.fill_color,
+            self.config.back_color,
+            self.config.mask_pattern,
         )
-        qr.add_data(data)
-        qr.make(fit=True)
 
-        return qr.make_image(
-            fill=self.config.fill_color, back_color=self.config.back_color
+    def generate_matrix(self, data: str) -> QRMatrix:
+        """
+        Generate the QR code module matrix for the given data.
+
+        Args:
+            data: The data to encode in the QR code
+
+        Returns:
+            The QR code modules by row, border included
+        """
+        return _build_qr_matrix(
+            data,
+            self.config.version,
+            self.config.error_correction,
+            self.config.border,
+            self.config.mask_pattern,
         )
 
 
@@ -112,32 +301,121 @@ class FileSystem:
         """
         image.save(file_path)
 
+    def save_bytes(self, data: bytes, file_path: str) -> None:
+        """
+        Save already encoded data to a file.
+
+        Args:
+            data: The bytes to save
+            file_path: Path where the data should be saved
+        """
+        with open(file_path, "wb") as file:
+            file.write(data)
+
 
 class CSVDataReader:
     """Class responsible for reading data from CSV files."""
 
-    def read_file(self, file_path: str, skip_rows: int = 0) -> pd.DataFrame:
+    def read_file(
+        self, file_path: str, skip_rows: int = 0, usecols: Optional[List[int]] = None
+    ) -> pd.DataFrame:
+        """
+        Read data from a CSV file as strings, keeping the text as written.
+
+        Args:
+            file_path: Path to the CSV file
+            skip_rows: Number of rows to skip at the beginning
+            usecols: Indexes of the columns to read (defaults to all)
+
+        Returns:
+            DataFrame containing the CSV data, with blank cells as ""
+        """
+        return self._read_csv(file_path, skip_rows, usecols)
+
+    def read_iter(
+        self,
+        file_path: str,
+        chunksize: int,
+        skip_rows: int = 0,
+        usecols: Optional[List[int]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read data from a CSV file like read_file, in chunks of rows.
+
+        Args:
+            file_path: Path to the CSV file
+            chunksize: Number of rows in each chunk
+            skip_rows: Number of rows to skip at the beginning
+            usecols: Indexes of the columns to read (defaults to all)
+
+        Returns:
+            Iterator over DataFrames holding consecutive chunks of the CSV data;
+            it keeps the file open until closed, so use it in a with statement
         """
-        Read data from a CSV file.
+        return self._read_csv(file_path, skip_rows, usecols, chunksize)
+
+    def _read_csv(
+        self,
+        file_path: str,
+        skip_rows: int,
+        usecols: Optional[List[int]],
+        chunksize: Optional[int] = None,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Read a CSV file with the parsing options shared by both readers.
 
         Args:
             file_path: Path to the CSV file
             skip_rows: Number of rows to skip at the beginning
+            usecols: Indexes of the columns to read (defaults to all)
+            chunksize: Number of rows in each chunk, or None to read all rows
 
         Returns:
-            DataFrame containing the CSV data
+            DataFrame, or iterator over DataFrames when chunksize is given
         """
-        return pd.read_csv(file_path, skiprows=skip_rows, header=None)
+        # The pyarrow engine infers numbers before casting to string, which
+        # would turn an ID like "001" into "1"
+        return pd.read_csv(
+            file_path,
+            skiprows=skip_rows,
+            header=None,
+            usecols=usecols,
+            dtype="string[pyarrow]",
+            na_filter=False,
+            chunksize=chunksize,
+        )
+
+
+# Runs of dark modules in a row of a QR code matrix, written out as bits
+_DARK_RUN = re.compile("1+")
 
 
 class PDFGenerator:
     """Class responsible for generating PDFs."""
 
-    def __init__(self, config: PDFConfig):
+    def __init__(
+        self,
+        config: PDFConfig,
+        qr_fill_color: str = "black",
+        qr_back_color: str = "white",
+    ):
         self.config = config
+        self.qr_fill_color = toColor(qr_fill_color)
+        self.qr_back_color = toColor(qr_back_color)
+
+        # Page layout, derived once from the config
+        page_width, page_height = config.page_size
+        y_position = page_height - 100
+        self._x_center = page_width / 2
+        self._title_y = y_position - config.title_y_offset
+        self._qr_xy = (
+            self._x_center - config.qr_size / 2,
+            y_position - config.qr_size - config.qr_y_offset,
+        )
+        self._number_y = y_position - config.qr_size - config.number_y_offset
 
     def generate_pdf(
-        self, output_path: str, name: str, number: str, qr_image_path: str
+        self, output_path: str, name: str, number: str, qr_matrix: QRMatrix
     ) -> None:
         """
         Generate a PDF with a name, number, and QR code.
@@ -146,55 +424,108 @@ class PDFGenerator:
             output_path: Path where the PDF will be saved
             name: The name to display in the PDF
             number: The number to display in the PDF
-            qr_image_path: Path to the QR code image
+            qr_matrix: The QR code modules by row
         """
         # Create PDF canvas with custom page size
         c = canvas.Canvas(output_path, pagesize=self.config.page_size)
+        self.draw_page(c, name, number, qr_matrix)
 
-        # Calculate center positions
-        page_width, page_height = self.config.page_size
-        x_center = page_width / 2
-        y_position = page_height - 100
+        # Save the PDF
+        c.save()
 
-        # Draw background image
-        c.drawImage(
-            self.config.background_image, 0, 0, width=page_width, height=page_height
-        )
+    def draw_page(
+        self, c: canvas.Canvas, name: str, number: str, qr_matrix: QRMatrix
+    ) -> None:
+        """
+        Draw a page with a name, number, and QR code and finish it.
 
-        # Add name (title)
-        c.setFont(
-            self.config.title_font,
-            (
-                self.config.title_font_size
-                if len(name) < 22
-                else self.config.title_font_size // 2
-            ),
-        )
-        c.setFillColorRGB(*self.config.title_color)
-        c.drawCentredString(x_center, y_position - self.config.title_y_offset, name)
-
-        # Add QR code
-        qr_img = ImageReader(qr_image_path)
-        qr_half_size = self.config.qr_size / 2
-        c.drawImage(
-            qr_img,
-            x_center - qr_half_size,
-            y_position - self.config.qr_size - self.config.qr_y_offset,
-            self.config.qr_size,
-            self.config.qr_size,
-        )
+        Args:
+            c: The canvas to draw the page on
+            name: The name to display on the page
+            number: The number to display on the page
+            qr_matrix: The QR code modules by row
+        """
+        self.draw_pages(c, ((name, number, qr_matrix),))
 
-        # Add number
-        c.setFont(self.config.number_font, self.config.number_font_size)
-        c.setFillColorRGB(*self.config.number_color)
-        c.drawCentredString(
-            x_center,
-            y_position - self.config.qr_size - self.config.number_y_offset,
-            number,
-        )
+    def draw_pages(
+        self, c: canvas.Canvas, pages: Iterable[Tuple[str, str, QRMatrix]]
+    ) -> None:
+        """
+        Draw a batch of pages, each with a name, number, and QR code.
 
-        # Save the PDF
-        c.save()
+        Args:
+            c: The canvas to draw the pages on
+            pages: The name, number, and QR code modules of each page
+        """
+        # Bind the settings used on every page to locals once per batch
+        config = self.config
+        page_width, page_height = config.page_size
+        background_image = config.background_image
+        title_font = config.title_font
+        title_font_size = config.title_font_size
+        title_color = config.title_color
+        number_font = config.number_font
+        number_font_size = config.number_font_size
+        number_color = config.number_color
+        x_center = self._x_center
+        title_y = self._title_y
+        number_y = self._number_y
+        draw_qr = self._draw_qr
+
+        for name, number, qr_matrix in pages:
+            # Draw background image
+            c.drawImage(background_image, 0, 0, width=page_width, height=page_height)
+
+            # Add QR code
+            draw_qr(c, qr_matrix)
+
+            # Add name (title)
+            c.setFont(
+                title_font,
+                (title_font_size if len(name) < 22 else title_font_size // 2),
+            )
+            c.setFillColorRGB(*title_color)
+            c.drawCentredString(x_center, title_y, name)
+
+            # Add number, keeping the fill color when it matches the title's
+            c.setFont(number_font, number_font_size)
+            if number_color != title_color:
+                c.setFillColorRGB(*number_color)
+            c.drawCentredString(x_center, number_y, number)
+
+            # Finish the page
+            c.showPage()
+
+    def _draw_qr(self, c: canvas.Canvas, qr_matrix: QRMatrix) -> None:
+        """
+        Draw a QR code as vector shapes, merging runs of dark modules.
+
+        Args:
+            c: The canvas to draw the QR code on
+            qr_matrix: The QR code modules by row
+        """
+        x0, y0 = self._qr_xy
+        qr_size = self.config.qr_size
+        width = len(qr_matrix)
+        module_size = qr_size / width
+
+        c.setFillColor(self.qr_back_color)
+        c.rect(x0, y0, qr_size, qr_size, fill=1, stroke=0)
+
+        path = c.beginPath()
+        y = y0 + qr_size
+        for row in qr_matrix:
+            y -= module_size
+            for run in _DARK_RUN.finditer(format(row, f"0{width}b")):
+                run_start, run_end = run.span()
+                path.rect(
+                    x0 + run_start * module_size,
+                    y,
+                    (run_end - run_start) * module_size,
+                    module_size,
+                )
+        c.setFillColor(self.qr_fill_color)
+        c.drawPath(path, fill=1, stroke=0)
 
 
 class FontManager:
@@ -212,6 +543,120 @@ class FontManager:
         pdfmetrics.registerFont(TTFont(font_name, font_path))
 
 
+# Fonts used in PDFs, registered in every process that renders them
+FONTS = (
+    ("BNazanin", "BNazanin.ttf"),
+    ("Vazir-Bold", "Vazir-Bold.ttf"),
+)
+
+# Per-process services, set once by _init_worker
+_file_system: Optional[FileSystem] = None
+_qr_generator: Optional[QRCodeGenerator] = None
+_pdf_generator: Optional[PDFGenerator] = None
+
+
+def _register_fonts() -> None:
+    """Register the fonts used in PDFs."""
+    for font_name, font_path in FONTS:
+        FontManager.register_font(font_name, font_path)
+
+
+def _init_worker(qr_config: QRCodeConfig, pdf_config: PDFConfig) -> None:
+    """
+    Prepare a worker process for rendering records.
+
+    Args:
+        qr_config: Configuration for QR code generation
+        pdf_config: Configuration for PDF generation
+    """
+    global _file_system, _qr_generator, _pdf_generator
+
+    _register_fonts()
+    _file_system = FileSystem()
+    _qr_generator = QRCodeGenerator(qr_config)
+    _pdf_generator = PDFGenerator(
+        pdf_config, qr_config.fill_color, qr_config.back_color
+    )
+
+
+def _save_qr_png(
+    qr_generator: QRCodeGenerator,
+    file_system: FileSystem,
+    number: str,
+    qr_img_path: str,
+) -> QRMatrix:
+    """
+    Generate a QR code, save it as a PNG file and return its module matrix.
+
+    Args:
+        qr_generator: Generator for the QR code
+        file_system: File system used to save the QR code
+        number: The data to encode in the QR code
+        qr_img_path: Path where the QR code PNG is saved
+
+    Returns:
+        The QR code modules by row
+    """
+    qr_matrix, png = qr_generator.generate_matrix_and_png(number)
+    file_system.save_bytes(png, qr_img_path)
+    return qr_matrix
+
+
+def _process_one(record: Tuple[str, str, str, str], save_qr_png: bool) -> str:
+    """
+    Generate the QR code and PDF for a single record.
+
+    Args:
+        record: The display name, number, QR code path and PDF path
+        save_qr_png: Whether to also save the QR code as a PNG file
+
+    Returns:
+        Path of the generated PDF
+    """
+    if _file_system is None or _qr_generator is None or _pdf_generator is None:
+        raise RuntimeError("Worker services are not initialized")
+
+    farsi_name, number, qr_img_path, pdf_file = record
+    if save_qr_png:
+        qr_matrix = _save_qr_png(_qr_generator, _file_system, number, qr_img_path)
+    else:
+        qr_matrix = _qr_generator.generate_matrix(number)
+    _pdf_generator.generate_pdf(pdf_file, farsi_name, number, qr_matrix)
+
+    return pdf_file
+
+
+def _prepare_records(
+    df: pd.DataFrame,
+    qr_dir: str,
+    pdf_dir: str,
+    name_column_index: int,
+    number_column_index: int,
+) -> List[Tuple[str, str, str, str]]:
+    """
+    Derive the display names and output paths for a chunk of CSV data.
+
+    Args:
+        df: DataFrame containing the CSV data
+        qr_dir: Directory to save QR codes
+        pdf_dir: Directory to save PDFs
+        name_column_index: Index of the column containing names
+        number_column_index: Index of the column containing numbers
+
+    Returns:
+        The display name, number, QR code path and PDF path of each record
+    """
+    # Build output paths for all records at once
+    stems = df.index.to_series().add(1).astype(str) + "-" + df[name_column_index]
+    qr_paths = os.path.join(qr_dir, "") + stems + ".png"
+    pdf_paths = os.path.join(pdf_dir, "") + stems + ".pdf"
+
+    # Process Farsi names for all records at once
+    farsi_names = df[name_column_index].map(FarsiTextProcessor.process_text)
+
+    return list(zip(farsi_names, df[number_column_index], qr_paths, pdf_paths))
+
+
 def process_records(
     csv_file: str,
     qr_dir: str,
@@ -221,6 +666,12 @@ def process_records(
     name_column_index: int = 0,
     number_column_index: int = 1,
     skip_rows: int = 1,
+    max_workers: Optional[int] = None,
+    save_qr_png: bool = False,
+    single_file: bool = False,
+    single_file_name: str = "records.pdf",
+    csv_chunksize: Optional[int] = None,
+    png_threads: Optional[int] = None,
 ) -> None:
     """
     Process records from a CSV file to generate QR codes and PDFs.
@@ -234,48 +685,116 @@ def process_records(
         name_column_index: Index of the column containing names
         number_column_index: Index of the column containing numbers
         skip_rows: Number of rows to skip in the CSV file
+        max_workers: Number of worker processes (defaults to the CPU count)
+        save_qr_png: Whether to also save QR codes as PNG files in qr_dir
+        single_file: Whether to write all records as pages of a single PDF
+        single_file_name: File name of the single PDF inside pdf_dir
+        csv_chunksize: Number of CSV rows to read and process at a time,
+            capping memory use for large files (defaults to reading all rows)
+        png_threads: Number of threads saving QR code PNGs in single_file mode
+            (defaults to the CPU count, at most 8)
     """
     # Initialize services
     file_system = FileSystem()
     csv_reader = CSVDataReader()
-    qr_generator = QRCodeGenerator(qr_config)
-    pdf_generator = PDFGenerator(pdf_config)
-    text_processor = FarsiTextProcessor()
 
     # Create output directories
-    file_system.create_directory(qr_dir)
+    if save_qr_png:
+        file_system.create_directory(qr_dir)
     file_system.create_directory(pdf_dir)
 
-    # Read CSV data
-    df = csv_reader.read_file(csv_file, skip_rows)
-
-    # Process each record
-    for index, row in df.iterrows():
-        raw_name = str(row[name_column_index])
-        number = str(row[number_column_index])
-
-        # Process Farsi text
-        farsi_name = text_processor.process_text(raw_name)
-
-        # Generate and save QR code
-        qr_image = qr_generator.generate(number)
-        qr_img_path = os.path.join(qr_dir, f"{index+1}-{raw_name}.png")
-        file_system.save_image(qr_image, qr_img_path)
-
-        # Generate PDF
-        pdf_file = os.path.join(pdf_dir, f"{index+1}-{raw_name}.pdf")
-        pdf_generator.generate_pdf(pdf_file, farsi_name, number, qr_img_path)
+    # Read CSV data, all at once or in chunks; the chunk reader is closed
+    # on the way out, even if rendering fails
+    usecols = [name_column_index, number_column_index]
+    if csv_chunksize is None:
+        reader = nullcontext(
+            [csv_reader.read_file(csv_file, skip_rows, usecols=usecols)]
+        )
+    else:
+        reader = csv_reader.read_iter(
+            csv_file, csv_chunksize, skip_rows, usecols=usecols
+        )
 
-        print(f"PDF generated: {pdf_file}")
+    with reader as chunks:
+        if single_file:
+            # Draw every record onto one canvas; resources are embedded once
+            _register_fonts()
+            qr_generator = QRCodeGenerator(qr_config)
+            pdf_generator = PDFGenerator(
+                pdf_config, qr_config.fill_color, qr_config.back_color
+            )
+            pdf_file = os.path.join(pdf_dir, single_file_name)
+            c = canvas.Canvas(pdf_file, pagesize=pdf_config.page_size)
+
+            # PNG files are encoded and saved by threads (Pillow releases the
+            # GIL while encoding) while this thread draws the pages from the
+            # matrices they return
+            png_pool = None
+            if save_qr_png:
+                png_pool = ThreadPoolExecutor(
+                    max_workers=png_threads or min(8, os.cpu_count() or 1)
+                )
+            try:
+                for chunk in chunks:
+                    records = _prepare_records(
+                        chunk, qr_dir, pdf_dir, name_column_index, number_column_index
+                    )
+                    if png_pool is not None:
+                        png_saves = [
+                            png_pool.submit(
+                                _save_qr_png,
+                                qr_generator,
+                                file_system,
+                                number,
+                                qr_img_path,
+                            )
+                            for _, number, qr_img_path, _ in records
+                        ]
+                        # Drawing waits for each save in turn, so pending work
+                        # stays bounded by the chunk size and failures surface
+                        pages = (
+                            (farsi_name, number, png_save.result())
+                            for (farsi_name, number, _, _), png_save in zip(
+                                records, png_saves
+                            )
+                        )
+                    else:
+                        pages = (
+                            (farsi_name, number, qr_generator.generate_matrix(number))
+                            for farsi_name, number, _, _ in records
+                        )
+
+                    # Draw the chunk as one batch of pages
+                    pdf_generator.draw_pages(c, pages)
+            finally:
+                if png_pool is not None:
+                    png_pool.shutdown()
+            c.save()
+
+            print(f"PDF generated: {pdf_file}")
+            print("All PDFs created successfully!")
+            return
+
+        # Process records in parallel; each one is independent, so workers
+        # pull them in batches and results are reported as they complete.
+        # Each chunk is drained before the next one is read.
+        processes = max_workers or os.cpu_count() or 1
+        process_one = partial(_process_one, save_qr_png=save_qr_png)
+        with mp.Pool(
+            processes, initializer=_init_worker, initargs=(qr_config, pdf_config)
+        ) as pool:
+            for chunk in chunks:
+                rows = _prepare_records(
+                    chunk, qr_dir, pdf_dir, name_column_index, number_column_index
+                )
+                chunksize = max(1, len(rows) // (processes * 4))
+                for pdf_file in pool.imap_unordered(process_one, rows, chunksize):
+                    print(f"PDF generated: {pdf_file}")
 
     print("All PDFs created successfully!")
 
 
 def main():
-    # Register Farsi font
-    FontManager.register_font("BNazanin", "BNazanin.ttf")
-    FontManager.register_font("Vazir-Bold", "Vazir-Bold.ttf")
-
     # Configuration
     csv_file = "list.csv"
     qr_dir = "QR_codes"